@@ -1,7 +1,28 @@
 """Slack Lists MCP Server Package."""
 
-from slack_lists_mcp.__main__ import main
-from slack_lists_mcp.server import mcp
+import importlib
 
 __version__ = "0.1.0"
 __all__ = ["main", "mcp"]
+
+# Loaded on first access so importing the models or the Slack client does not
+# pull in fastmcp and build every tool schema.
+_LAZY_ATTRS = {
+    "main": "slack_lists_mcp.__main__",
+    "mcp": "slack_lists_mcp.server",
+}
+
+
+def __getattr__(name):
+    """Import ``main`` and ``mcp`` on first access."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__():
+    """List the lazy attributes alongside the loaded ones."""
+    return sorted([*globals(), *_LAZY_ATTRS])
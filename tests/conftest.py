@@ -3,14 +3,19 @@
 import os
 import sys
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
+import pytest_asyncio
+from slack_sdk import WebClient
+from slack_sdk.web.base_client import BaseClient
 
-# Add the src directory to the Python path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+# Add the src directory to the Python path (once, even if conftest is re-imported)
+src_path = str((Path(__file__).parent.parent / "src").resolve())
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
-# Set test environment variables
+# Set test environment variables before the server module reads its settings
 os.environ["SLACK_BOT_TOKEN"] = "test-token"
 os.environ["LOG_LEVEL"] = "DEBUG"
 
@@ -23,9 +28,80 @@ def mock_env(monkeypatch):
     yield
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _no_slack_http():
+    """Fail fast if any test reaches slack_sdk's HTTP layer.
+
+    Replacing the request method also skips the SDK's retry handlers, so an
+    unmocked call errors immediately instead of retrying against the network.
+    """
+    with patch.object(
+        BaseClient,
+        "_perform_urllib_http_request",
+        side_effect=RuntimeError("tests must not call the Slack API"),
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def _web_client_patch():
+    """Patch WebClient once for the whole session."""
+    from slack_lists_mcp import slack_client as slack_client_module
+
+    with patch.object(slack_client_module, "WebClient") as mock:
+        mock.return_value = Mock(spec=WebClient)
+        mock.return_value.api_call = Mock()
+        yield mock
+
+
+@pytest.fixture
+def mock_slack_client(_web_client_patch):
+    """Return the mock Slack client, reset for the current test.
+
+    The instance is shared by the whole session. reset_mock clears what a test
+    configured on it but cannot undo a replaced ``api_call``, so every test
+    starts from a fresh one. This runs at setup, after the previous test's
+    fixtures (including monkeypatch) have been torn down, so fixture order in
+    a test's signature doesn't matter.
+    """
+    mock_instance = _web_client_patch.return_value
+    mock_instance.api_call = Mock()
+    mock_instance.reset_mock(return_value=True, side_effect=True)
+    return mock_instance
+
+
 @pytest.fixture
+def client(mock_slack_client):
+    """SlackListsClient whose WebClient is the reset mock_slack_client."""
+    from slack_lists_mcp.slack_client import SlackListsClient
+
+    return SlackListsClient()
+
+
+@pytest.fixture(scope="session")
+def mcp():
+    """The FastMCP server, imported on first use.
+
+    Importing the server builds every tool schema, so modules that only need
+    the models or the Slack client never pay for it.
+    """
+    from slack_lists_mcp.server import mcp
+
+    return mcp
+
+
+@pytest_asyncio.fixture(scope="module")
+async def mcp_client(mcp):
+    """Connected MCP client shared by all tests in a module."""
+    from fastmcp import Client
+
+    async with Client(mcp) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
 def sample_list_schema():
-    """Sample list schema for testing."""
+    """Sample list schema, built once per session. Do not mutate."""
     return [
         {
             "id": "Col123",
@@ -77,9 +153,9 @@ def sample_list_schema():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_items():
-    """Sample list items for testing."""
+    """Sample list items, built once per session. Do not mutate."""
     return [
         {
             "id": "Rec1",
@@ -114,18 +190,22 @@ def sample_items():
     ]
 
 
-@pytest.fixture
-def rich_text_field():
-    """Sample rich text field structure."""
-    return {
-        "type": "rich_text",
-        "elements": [
-            {
-                "type": "rich_text_section",
-                "elements": [
-                    {"type": "text", "text": "Sample text"}
-                ],
-            }
-        ],
-    }
+def rich_text_block(text):
+    """Build the rich_text value Slack expects for a plain string."""
+    return [
+        {
+            "type": "rich_text",
+            "elements": [
+                {
+                    "type": "rich_text_section",
+                    "elements": [{"type": "text", "text": text}],
+                },
+            ],
+        },
+    ]
+
 
+@pytest.fixture(scope="session")
+def rich_text_field():
+    """Sample rich text field structure, built once per session. Do not mutate."""
+    return rich_text_block("Sample text")[0]
@@ -1,16 +1,24 @@
 """Tests for data models."""
 
+import json
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter
+from pydantic_core import ValidationError
 
 from slack_lists_mcp.models import (
     AddItemRequest,
+    CellData,
     DeleteItemRequest,
     ErrorResponse,
     GetItemRequest,
     ListItemsRequest,
     UpdateItemRequest,
 )
+from tests.conftest import rich_text_block
+
+_LIST_ITEMS_REQUEST_ADAPTER = TypeAdapter(ListItemsRequest)
+_CELLS_ADAPTER = TypeAdapter(list[CellData])
 
 
 class TestAddItemRequest:
@@ -23,27 +31,14 @@ class TestAddItemRequest:
             initial_fields=[
                 {
                     "column_id": "Col123",
-                    "rich_text": [
-                        {
-                            "type": "rich_text",
-                            "elements": [
-                                {
-                                    "type": "rich_text_section",
-                                    "elements": [
-                                        {"type": "text", "text": "Test"},
-                                    ],
-                                },
-                            ],
-                        },
-                    ],
+                    "rich_text": rich_text_block("Test"),
                 },
             ],
         )
 
         assert request.list_id == "F123"
-        assert len(request.initial_fields) == 1
         # initial_fields contains FieldData objects
-        assert request.initial_fields[0].column_id == "Col123"
+        assert [f.column_id for f in request.initial_fields] == ["Col123"]
 
     def test_missing_required_fields(self):
         """Test that missing required fields raises validation error."""
@@ -77,15 +72,17 @@ class TestUpdateItemRequest:
         )
 
         assert request.list_id == "F123"
-        assert len(request.cells) == 1
         # cells contains CellData objects
-        assert request.cells[0].row_id == "Rec123"
+        assert [c.row_id for c in request.cells] == ["Rec123"]
 
-    def test_multiple_cells(self):
-        """Test updating multiple cells."""
-        request = UpdateItemRequest(
-            list_id="F123",
-            cells=[
+
+class TestCellData:
+    """Tests for CellData model."""
+
+    def test_multiple_cells_validate_from_dicts(self):
+        """Test multiple CellData validate from dicts."""
+        cells = _CELLS_ADAPTER.validate_python(
+            [
                 {
                     "row_id": "Rec123",
                     "column_id": "Col123",
@@ -99,9 +96,7 @@ class TestUpdateItemRequest:
             ],
         )
 
-        assert len(request.cells) == 2
-        # cells contains CellData objects
-        assert request.cells[1].checkbox is True
+        assert [c.checkbox for c in cells] == [None, True]
 
 
 class TestDeleteItemRequest:
@@ -162,71 +157,68 @@ class TestGetItemRequest:
 class TestListItemsRequest:
     """Tests for ListItemsRequest model."""
 
-    def test_valid_request(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {},
+                {
+                    "limit": 100,
+                    "cursor": None,
+                    "archived": None,
+                    "completed_only": None,
+                    "assignee": None,
+                    "sort_by": None,
+                    "sort_order": None,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {
+                    "limit": 50,
+                    "cursor": "page_token",
+                    "archived": True,
+                    "completed_only": True,
+                    "assignee": "U123",
+                    "sort_by": "created_at",
+                    "sort_order": "desc",
+                },
+                {
+                    "limit": 50,
+                    "cursor": "page_token",
+                    "archived": True,
+                    "completed_only": True,
+                    "assignee": "U123",
+                    "sort_by": "created_at",
+                    "sort_order": "desc",
+                },
+                id="all_parameters",
+            ),
+            pytest.param({"limit": 1}, {"limit": 1}, id="min_limit"),
+            pytest.param({"limit": 1000}, {"limit": 1000}, id="max_limit"),
+            pytest.param(
+                {"sort_by": "updated_at", "sort_order": "asc"},
+                {"sort_by": "updated_at", "sort_order": "asc"},
+                id="sort_parameters",
+            ),
+        ],
+    )
+    def test_valid_request(self, kwargs, expected):
         """Test creating a valid ListItemsRequest."""
-        request = ListItemsRequest(
-            list_id="F123",
+        request = _LIST_ITEMS_REQUEST_ADAPTER.validate_python(
+            {"list_id": "F123", **kwargs},
         )
 
         assert request.list_id == "F123"
-        assert request.limit == 100  # Default
-        assert request.cursor is None
-        assert request.archived is None
-        assert request.completed_only is None
-        assert request.assignee is None
-
-    def test_with_all_parameters(self):
-        """Test with all parameters specified."""
-        request = ListItemsRequest(
-            list_id="F123",
-            limit=50,
-            cursor="page_token",
-            archived=True,
-            completed_only=True,
-            assignee="U123",
-            sort_by="created_at",
-            sort_order="desc",
-        )
-
-        assert request.limit == 50
-        assert request.cursor == "page_token"
-        assert request.archived is True
-        assert request.completed_only is True
-        assert request.assignee == "U123"
-        assert request.sort_by == "created_at"
-        assert request.sort_order == "desc"
-
-    def test_limit_validation(self):
-        """Test limit parameter validation."""
-        # Valid limits
-        request = ListItemsRequest(list_id="F123", limit=1)
-        assert request.limit == 1
-
-        request = ListItemsRequest(list_id="F123", limit=1000)
-        assert request.limit == 1000
+        assert request.model_dump(include=set(expected)) == expected
 
-        # Invalid limits
+    @pytest.mark.parametrize("limit", [0, 1001])
+    def test_limit_out_of_range(self, limit):
+        """Test that limits outside 1-1000 raise a validation error."""
         with pytest.raises(ValidationError):
-            ListItemsRequest(list_id="F123", limit=0)
-
-        with pytest.raises(ValidationError):
-            ListItemsRequest(list_id="F123", limit=1001)
-
-    def test_sort_parameters(self):
-        """Test sort parameters."""
-        request = ListItemsRequest(
-            list_id="F123",
-            sort_by="updated_at",
-            sort_order="asc",
-        )
-
-        assert request.sort_by == "updated_at"
-        assert request.sort_order == "asc"
-
-        # Test defaults
-        request2 = ListItemsRequest(list_id="F123")
-        assert request2.sort_by is None
-        assert request2.sort_order is None
+            _LIST_ITEMS_REQUEST_ADAPTER.validate_python(
+                {"list_id": "F123", "limit": limit},
+            )
 
 
 class TestErrorResponse:
@@ -265,6 +257,8 @@ class TestErrorResponse:
             details={"key": "value"},
         )
 
-        json_data = error.model_dump_json()
-        assert "test_code" in json_data
-        assert "Test error" in json_data
+        assert json.loads(error.model_dump_json()) == {
+            "error": "Test error",
+            "error_code": "test_code",
+            "details": {"key": "value"},
+        }
@@ -1,536 +1,506 @@
 """Tests for the Slack Lists MCP server."""
 
-from unittest.mock import AsyncMock, patch
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from fastmcp import Client
 
-from slack_lists_mcp.server import mcp
+from tests.conftest import rich_text_block
 
 
-@pytest.mark.asyncio
-async def test_server_initialization():
-    """Test that the server initializes correctly."""
-    assert mcp is not None
-    assert mcp.name == "Slack Lists MCP Server"
+class _AsyncStub:
+    """Async stand-in for a client method that records each call's kwargs.
 
+    Returns ``return_value``, or raises the ``raises`` exception if one is given.
+    """
 
-@pytest.mark.asyncio
-async def test_get_list_structure_tool():
-    """Test the get_list_structure tool."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        # Mock the response
-        mock_client.list_items = AsyncMock(
-            return_value={
-                "items": [{"id": "test_item"}],
-            },
-        )
-        mock_client.get_item = AsyncMock(
-            return_value={
-                "list": {
-                    "list_metadata": {
-                        "schema": [
-                            {
-                                "id": "Col123",
-                                "name": "Name",
-                                "key": "name",
-                                "type": "text",
-                                "is_primary_column": True,
-                            },
-                        ],
-                        "views": [],
-                    },
-                },
-                "record": {},
-            },
-        )
+    def __init__(self, return_value=None, raises=None):
+        self.return_value = return_value
+        self.raises = raises
+        self.calls = []
 
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "get_list_structure",
-                {"list_id": "test_list"},
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert "structure" in result_data
-            assert result_data["structure"]["list_id"] == "test_list"
-
-
-@pytest.mark.asyncio
-async def test_add_list_item_tool():
-    """Test the add_list_item tool with correct initial_fields."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.add_item = AsyncMock(
-            return_value={
-                "id": "test_item_id",
-                "fields": [
-                    {
-                        "column_id": "Col123",
-                        "text": "Test Item",
-                    },
-                ],
-            },
-        )
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.raises is not None:
+            raise self.raises
+        return self.return_value
 
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "add_list_item",
-                {
-                    "list_id": "test_list",
-                    "initial_fields": [
-                        {
-                            "column_id": "Col123",
-                            "rich_text": [
-                                {
-                                    "type": "rich_text",
-                                    "elements": [
-                                        {
-                                            "type": "rich_text_section",
-                                            "elements": [
-                                                {"type": "text", "text": "Test Item"},
-                                            ],
-                                        },
-                                    ],
-                                },
-                            ],
-                        },
-                    ],
-                },
-            )
 
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert "item" in result_data
-            mock_client.add_item.assert_called_once()
+def _fake_client(monkeypatch, **methods):
+    """Install a client exposing only the given methods as the server's client."""
+    client = SimpleNamespace(**methods)
+    monkeypatch.setattr("slack_lists_mcp.server.slack_client", client)
+    return client
 
 
-@pytest.mark.asyncio
-async def test_update_list_item_tool():
-    """Test the update_list_item tool."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.update_item = AsyncMock(return_value={"success": True})
+_STRUCTURE_LIST_ITEMS_RESPONSE = {
+    "items": [{"id": "test_item"}],
+}
 
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "update_list_item",
+_STRUCTURE_GET_ITEM_RESPONSE = {
+    "list": {
+        "list_metadata": {
+            "schema": [
                 {
-                    "list_id": "test_list",
-                    "cells": [
-                        {
-                            "row_id": "Rec123",
-                            "column_id": "Col123",
-                            "rich_text": [
-                                {
-                                    "type": "rich_text",
-                                    "elements": [
-                                        {
-                                            "type": "rich_text_section",
-                                            "elements": [
-                                                {
-                                                    "type": "text",
-                                                    "text": "Updated Item",
-                                                },
-                                            ],
-                                        },
-                                    ],
-                                },
-                            ],
-                        },
-                    ],
+                    "id": "Col123",
+                    "name": "Name",
+                    "key": "name",
+                    "type": "text",
+                    "is_primary_column": True,
                 },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            mock_client.update_item.assert_called_once()
-
+            ],
+            "views": [],
+        },
+    },
+    "record": {},
+}
+
+_ADD_ITEM_RESPONSE = {
+    "id": "test_item_id",
+    "fields": [
+        {
+            "column_id": "Col123",
+            "text": "Test Item",
+        },
+    ],
+}
+
+_ITEM = {
+    "id": "test_item",
+    "fields": [
+        {"column_id": "Col123", "text": "Test Item"},
+    ],
+}
+
+# Shape returned by SlackListsClient.get_item, which renames Slack's "record"
+_GET_ITEM_RESPONSE = {
+    "item": _ITEM,
+    "list": {"list_metadata": {"schema": []}},
+    "subtasks": [],
+}
+
+_LIST_ITEMS_RESPONSE = {
+    "items": [
+        {"id": "item1", "fields": []},
+        {"id": "item2", "fields": []},
+    ],
+    "has_more": False,
+    "next_cursor": None,
+    "total": 2,
+}
+
+_FILTERED_LIST_ITEMS_RESPONSE = {
+    "items": [
+        {
+            "id": "item1",
+            "fields": [
+                {"key": "name", "text": "Test Task"},
+            ],
+        },
+    ],
+    "has_more": False,
+    "next_cursor": None,
+    "total": 1,
+}
+
+_PAGINATED_LIST_ITEMS_RESPONSE = {
+    "items": [],
+    "has_more": True,
+    "next_cursor": "next_page_token",
+    "total": 100,
+}
+
+_EMPTY_LIST_ITEMS_RESPONSE = {
+    "items": [],
+    "has_more": False,
+    "next_cursor": None,
+    "total": 0,
+}
+
+_LIST_INFO_RESPONSE = {
+    "id": "test_list",
+    "name": "Test List",
+    "title": "Test List Title",
+    "list_metadata": {
+        "schema": [],
+        "views": [],
+    },
+}
+
+_CREATED_ITEM_RESPONSE = {"id": "test_item", "fields": []}
+
+
+async def test_server_initialization(mcp):
+    """Test that the server initializes correctly."""
+    assert mcp is not None
+    assert mcp.name == "Slack Lists MCP Server"
 
-@pytest.mark.asyncio
-async def test_delete_list_item_tool():
-    """Test the delete_list_item tool."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.delete_item = AsyncMock(return_value=True)
 
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "delete_list_item",
-                {
-                    "list_id": "test_list",
-                    "item_id": "test_item",
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert result_data["deleted"] is True
-            mock_client.delete_item.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_get_list_item_tool():
-    """Test the get_list_item tool."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.get_item = AsyncMock(
-            return_value={
-                "record": {
-                    "id": "test_item",
-                    "fields": [
-                        {"column_id": "Col123", "text": "Test Item"},
-                    ],
-                },
-                "list": {"list_metadata": {"schema": []}},
-                "subtasks": [],
+async def test_get_list_structure_tool(mcp_client, monkeypatch):
+    """Test the get_list_structure tool."""
+    _fake_client(
+        monkeypatch,
+        list_items=_AsyncStub(return_value=_STRUCTURE_LIST_ITEMS_RESPONSE),
+        get_item=_AsyncStub(return_value=_STRUCTURE_GET_ITEM_RESPONSE),
+    )
+
+    result = await mcp_client.call_tool(
+        "get_list_structure",
+        {"list_id": "test_list"},
+    )
+
+    assert result is not None
+    result_data = result.data
+    assert result_data["success"] is True
+    assert "structure" in result_data
+    assert result_data["structure"]["list_id"] == "test_list"
+
+
+_ADD_ITEM_ARGS = {
+    "list_id": "test_list",
+    "initial_fields": [
+        {
+            "column_id": "Col123",
+            "rich_text": rich_text_block("Test Item"),
+        },
+    ],
+}
+
+_UPDATE_ITEM_ARGS = {
+    "list_id": "test_list",
+    "cells": [
+        {
+            "row_id": "Rec123",
+            "column_id": "Col123",
+            "rich_text": rich_text_block("Test Item"),
+        },
+    ],
+}
+
+_ITEM_ARGS = {"list_id": "test_list", "item_id": "test_item"}
+
+# (tool, client method, tool arguments, client response,
+#  expected client call, expected tool result)
+SINGLE_CALL_TOOL_CASES = [
+    pytest.param(
+        "add_list_item",
+        "add_item",
+        _ADD_ITEM_ARGS,
+        _ADD_ITEM_RESPONSE,
+        _ADD_ITEM_ARGS,
+        {"success": True, "item": _ADD_ITEM_RESPONSE},
+        id="add_list_item",
+    ),
+    pytest.param(
+        "update_list_item",
+        "update_item",
+        _UPDATE_ITEM_ARGS,
+        {"success": True},
+        _UPDATE_ITEM_ARGS,
+        {"success": True},
+        id="update_list_item",
+    ),
+    pytest.param(
+        "delete_list_item",
+        "delete_item",
+        _ITEM_ARGS,
+        True,
+        _ITEM_ARGS,
+        {"success": True, "deleted": True, **_ITEM_ARGS},
+        id="delete_list_item",
+    ),
+    pytest.param(
+        "get_list_item",
+        "get_item",
+        _ITEM_ARGS,
+        _GET_ITEM_RESPONSE,
+        {**_ITEM_ARGS, "include_is_subscribed": False},
+        {
+            "success": True,
+            "item": _ITEM,
+            "list_metadata": {"schema": []},
+            "subtasks": [],
+        },
+        id="get_list_item",
+    ),
+    pytest.param(
+        "get_list_info",
+        "get_list",
+        {"list_id": "test_list"},
+        _LIST_INFO_RESPONSE,
+        {"list_id": "test_list"},
+        {"success": True, "list": _LIST_INFO_RESPONSE},
+        id="get_list_info",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("tool", "method", "args", "response", "expected_call", "expected"),
+    SINGLE_CALL_TOOL_CASES,
+)
+async def test_single_call_tool(
+    mcp_client,
+    monkeypatch,
+    tool,
+    method,
+    args,
+    response,
+    expected_call,
+    expected,
+):
+    """Test tools that wrap exactly one client call."""
+    mock_client = _fake_client(
+        monkeypatch, **{method: _AsyncStub(return_value=response)}
+    )
+
+    result = await mcp_client.call_tool(tool, args)
+
+    assert result is not None
+    assert result.data == expected
+    assert getattr(mock_client, method).calls == [expected_call]
+
+
+@pytest.mark.parametrize(
+    ("call_kwargs", "response", "expected_call"),
+    [
+        pytest.param(
+            {"list_id": "test_list"},
+            _LIST_ITEMS_RESPONSE,
+            {
+                "list_id": "test_list",
+                "limit": 20,
+                "cursor": None,
+                "archived": None,
+                "filters": None,
             },
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "get_list_item",
-                {
-                    "list_id": "test_list",
-                    "item_id": "test_item",
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert "item" in result_data
-            mock_client.get_item.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_list_items_tool():
-    """Test the list_items tool without filters."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.list_items = AsyncMock(
-            return_value={
-                "items": [
-                    {"id": "item1", "fields": []},
-                    {"id": "item2", "fields": []},
-                ],
-                "has_more": False,
-                "next_cursor": None,
-                "total": 2,
+            id="without_filters",
+        ),
+        pytest.param(
+            {
+                "list_id": "test_list",
+                "filters": {"name": {"contains": "Test"}},
             },
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "list_items",
-                {"list_id": "test_list"},
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert len(result_data["items"]) == 2
-            mock_client.list_items.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_list_items_with_filters():
-    """Test the list_items tool with filters."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.list_items = AsyncMock(
-            return_value={
-                "items": [
-                    {
-                        "id": "item1",
-                        "fields": [
-                            {"key": "name", "text": "Test Task"},
-                        ],
-                    },
-                ],
-                "has_more": False,
-                "next_cursor": None,
-                "total": 1,
+            _FILTERED_LIST_ITEMS_RESPONSE,
+            {
+                "list_id": "test_list",
+                "limit": 20,
+                "cursor": None,
+                "archived": None,
+                "filters": {"name": {"contains": "Test"}},
             },
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "list_items",
-                {
-                    "list_id": "test_list",
-                    "filters": {"name": {"contains": "Test"}},
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            # Check that filters were passed to the client
-            mock_client.list_items.assert_called_once_with(
-                list_id="test_list",
-                limit=20,
-                cursor=None,
-                archived=None,
-                filters={"name": {"contains": "Test"}},
-            )
-
-
-@pytest.mark.asyncio
-async def test_list_items_with_pagination():
-    """Test the list_items tool with pagination parameters."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.list_items = AsyncMock(
-            return_value={
-                "items": [],
-                "has_more": True,
-                "next_cursor": "next_page_token",
-                "total": 100,
+            id="with_filters",
+        ),
+        pytest.param(
+            {
+                "list_id": "test_list",
+                "limit": 10,
+                "cursor": "page_token",
             },
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "list_items",
-                {
-                    "list_id": "test_list",
-                    "limit": 10,
-                    "cursor": "page_token",
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert result_data["has_more"] is True
-            assert result_data["next_cursor"] == "next_page_token"
-            mock_client.list_items.assert_called_once_with(
-                list_id="test_list",
-                limit=10,
-                cursor="page_token",
-                archived=None,
-                filters=None,
-            )
-
-
-@pytest.mark.asyncio
-async def test_list_items_with_archived():
-    """Test the list_items tool with archived parameter."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.list_items = AsyncMock(
-            return_value={
-                "items": [],
-                "has_more": False,
-                "next_cursor": None,
-                "total": 0,
+            _PAGINATED_LIST_ITEMS_RESPONSE,
+            {
+                "list_id": "test_list",
+                "limit": 10,
+                "cursor": "page_token",
+                "archived": None,
+                "filters": None,
             },
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "list_items",
-                {
-                    "list_id": "test_list",
-                    "archived": True,
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            mock_client.list_items.assert_called_once_with(
-                list_id="test_list",
-                limit=20,
-                cursor=None,
-                archived=True,
-                filters=None,
-            )
-
-
-@pytest.mark.asyncio
-async def test_get_list_info_tool():
-    """Test the get_list_info tool."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.get_list = AsyncMock(
-            return_value={
-                "id": "test_list",
-                "name": "Test List",
-                "title": "Test List Title",
-                "list_metadata": {
-                    "schema": [],
-                    "views": [],
-                },
+            id="with_pagination",
+        ),
+        pytest.param(
+            {
+                "list_id": "test_list",
+                "archived": True,
             },
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "get_list_info",
-                {"list_id": "test_list"},
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is True
-            assert "list" in result_data
-            assert result_data["list"]["id"] == "test_list"
-            mock_client.get_list.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_error_handling():
+            _EMPTY_LIST_ITEMS_RESPONSE,
+            {
+                "list_id": "test_list",
+                "limit": 20,
+                "cursor": None,
+                "archived": True,
+                "filters": None,
+            },
+            id="with_archived",
+        ),
+    ],
+)
+async def test_list_items_tool(
+    mcp_client, monkeypatch, call_kwargs, response, expected_call
+):
+    """Test the list_items tool passes its arguments through and echoes the page."""
+    mock_client = _fake_client(
+        monkeypatch,
+        list_items=_AsyncStub(return_value=response),
+    )
+
+    result = await mcp_client.call_tool("list_items", call_kwargs)
+
+    assert result is not None
+    assert result.data == {"success": True, **response}
+    assert mock_client.list_items.calls == [expected_call]
+
+
+async def test_error_handling(mcp_client, monkeypatch):
     """Test error handling in tools."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.add_item = AsyncMock(
-            side_effect=Exception("API Error"),
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "add_list_item",
-                {
-                    "list_id": "test_list",
-                    "initial_fields": [
-                        {"column_id": "Col123", "text": "Test"},
-                    ],
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is False
-            assert "error" in result_data
-            assert "API Error" in result_data["error"]
-
-
-@pytest.mark.asyncio
-async def test_add_list_item_schema_error_handling():
+    _fake_client(
+        monkeypatch,
+        add_item=_AsyncStub(
+            raises=Exception("API Error"),
+        ),
+    )
+
+    result = await mcp_client.call_tool(
+        "add_list_item",
+        {
+            "list_id": "test_list",
+            "initial_fields": [
+                {"column_id": "Col123", "text": "Test"},
+            ],
+        },
+    )
+
+    assert result is not None
+    result_data = result.data
+    assert result_data["success"] is False
+    assert "error" in result_data
+    assert "API Error" in result_data["error"]
+
+
+async def test_add_list_item_schema_error_handling(mcp_client, monkeypatch):
     """Test that schema documentation is suggested on format errors."""
-    with patch("slack_lists_mcp.server.slack_client") as mock_client:
-        mock_client.add_item = AsyncMock(
-            side_effect=Exception(
+    _fake_client(
+        monkeypatch,
+        add_item=_AsyncStub(
+            raises=Exception(
                 "Invalid field format: column_id 'Col123' expects rich_text format",
             ),
-        )
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "add_list_item",
-                {
-                    "list_id": "test_list",
-                    "initial_fields": [
-                        {"column_id": "Col123", "text": "Test"},
-                    ],
-                },
-            )
-
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is False
-            assert "error" in result_data
-            assert "hint" in result_data
-            assert "get_list_structure" in result_data["hint"]
-            assert "column IDs" in result_data["hint"]
-
-
-@pytest.mark.asyncio
-async def test_slack_api_documentation_prompt():
+        ),
+    )
+
+    result = await mcp_client.call_tool(
+        "add_list_item",
+        {
+            "list_id": "test_list",
+            "initial_fields": [
+                {"column_id": "Col123", "text": "Test"},
+            ],
+        },
+    )
+
+    assert result is not None
+    result_data = result.data
+    assert result_data["success"] is False
+    assert "error" in result_data
+    assert "hint" in result_data
+    assert "get_list_structure" in result_data["hint"]
+    assert "column IDs" in result_data["hint"]
+
+
+_GUIDE_TERMS = {
+    "slackLists.items.create",
+    "initial_fields",
+    "column_id",
+    "rich_text",
+    "user",
+}
+# Longest first, so a term that is a prefix of another can't shadow it
+_GUIDE_TERMS_RE = re.compile(
+    "|".join(map(re.escape, sorted(_GUIDE_TERMS, key=len, reverse=True))),
+)
+
+
+async def test_slack_api_documentation_prompt(mcp_client):
     """Test the slack-api-documentation prompt."""
-    async with Client(mcp) as client:
-        result = await client.get_prompt("slack-api-documentation")
+    result = await mcp_client.get_prompt("slack-api-documentation")
 
-        assert result is not None
-        assert len(result.messages) > 0
+    assert result is not None
+    assert len(result.messages) > 0
 
-        # Check that the guide contains important information
-        guide_text = result.messages[0].content.text
-        assert "slackLists.items.create" in guide_text
-        assert "initial_fields" in guide_text
-        assert "column_id" in guide_text
-        assert "rich_text" in guide_text
-        assert "user" in guide_text
+    # Check that the guide contains important information
+    guide_text = result.messages[0].content.text
+    assert set(_GUIDE_TERMS_RE.findall(guide_text)) == _GUIDE_TERMS
 
 
-@pytest.mark.asyncio
-async def test_default_list_id_from_env():
+async def test_default_list_id_from_env(mcp_client, monkeypatch):
     """Test that tools use DEFAULT_LIST_ID from environment when list_id is not provided."""
     with patch("slack_lists_mcp.server.settings") as mock_settings:
         mock_settings.default_list_id = "default_list_123"
 
-        with patch("slack_lists_mcp.server.slack_client") as mock_client:
-            mock_client.add_item = AsyncMock(
-                return_value={"id": "test_item", "fields": []},
-            )
-
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "add_list_item",
-                    {
-                        "initial_fields": [
-                            {"column_id": "Col123", "text": "Test Item"},
-                        ],
-                    },
-                )
-
-                assert result is not None
-                result_data = result.data
-                assert result_data["success"] is True
-                # Verify that the default list ID was used
-                mock_client.add_item.assert_called_once_with(
-                    list_id="default_list_123",
-                    initial_fields=[{"column_id": "Col123", "text": "Test Item"}],
-                )
-
-
-@pytest.mark.asyncio
-async def test_missing_list_id_error():
+        mock_client = _fake_client(
+            monkeypatch,
+            add_item=_AsyncStub(return_value=_CREATED_ITEM_RESPONSE),
+        )
+
+        result = await mcp_client.call_tool(
+            "add_list_item",
+            {
+                "initial_fields": [
+                    {"column_id": "Col123", "text": "Test Item"},
+                ],
+            },
+        )
+
+        assert result is not None
+        result_data = result.data
+        assert result_data["success"] is True
+        # Verify that the default list ID was used
+        assert mock_client.add_item.calls == [
+            {
+                "list_id": "default_list_123",
+                "initial_fields": [{"column_id": "Col123", "text": "Test Item"}],
+            },
+        ]
+
+
+async def test_missing_list_id_error(mcp_client):
     """Test error when list_id is not provided and DEFAULT_LIST_ID is not set."""
     with patch("slack_lists_mcp.server.settings") as mock_settings:
         mock_settings.default_list_id = None
 
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "add_list_item",
-                {
-                    "initial_fields": [
-                        {"column_id": "Col123", "text": "Test Item"},
-                    ],
-                },
-            )
+        result = await mcp_client.call_tool(
+            "add_list_item",
+            {
+                "initial_fields": [
+                    {"column_id": "Col123", "text": "Test Item"},
+                ],
+            },
+        )
 
-            assert result is not None
-            result_data = result.data
-            assert result_data["success"] is False
-            assert "list_id is required" in result_data["error"]
-            assert "DEFAULT_LIST_ID environment variable" in result_data["error"]
+        assert result is not None
+        result_data = result.data
+        assert result_data["success"] is False
+        assert "list_id is required" in result_data["error"]
+        assert "DEFAULT_LIST_ID environment variable" in result_data["error"]
 
 
-@pytest.mark.asyncio
-async def test_list_id_parameter_override():
+async def test_list_id_parameter_override(mcp_client, monkeypatch):
     """Test that explicitly provided list_id overrides DEFAULT_LIST_ID."""
     with patch("slack_lists_mcp.server.settings") as mock_settings:
         mock_settings.default_list_id = "default_list_123"
 
-        with patch("slack_lists_mcp.server.slack_client") as mock_client:
-            mock_client.add_item = AsyncMock(
-                return_value={"id": "test_item", "fields": []},
-            )
-
-            async with Client(mcp) as client:
-                result = await client.call_tool(
-                    "add_list_item",
-                    {
-                        "list_id": "explicit_list_456",
-                        "initial_fields": [
-                            {"column_id": "Col123", "text": "Test Item"},
-                        ],
-                    },
-                )
-
-                assert result is not None
-                result_data = result.data
-                assert result_data["success"] is True
-                # Verify that the explicit list ID was used, not the default
-                mock_client.add_item.assert_called_once_with(
-                    list_id="explicit_list_456",
-                    initial_fields=[{"column_id": "Col123", "text": "Test Item"}],
-                )
+        mock_client = _fake_client(
+            monkeypatch,
+            add_item=_AsyncStub(return_value=_CREATED_ITEM_RESPONSE),
+        )
+
+        result = await mcp_client.call_tool(
+            "add_list_item",
+            {
+                "list_id": "explicit_list_456",
+                "initial_fields": [
+                    {"column_id": "Col123", "text": "Test Item"},
+                ],
+            },
+        )
+
+        assert result is not None
+        result_data = result.data
+        assert result_data["success"] is True
+        # Verify that the explicit list ID was used, not the default
+        assert mock_client.add_item.calls == [
+            {
+                "list_id": "explicit_list_456",
+                "initial_fields": [{"column_id": "Col123", "text": "Test Item"}],
+            },
+        ]
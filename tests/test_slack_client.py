@@ -1,255 +1,192 @@
 """Tests for the SlackListsClient."""
 
-from unittest.mock import MagicMock, patch
+import string
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 from slack_sdk.errors import SlackApiError
 
 from slack_lists_mcp.slack_client import SlackListsClient
+from tests.conftest import rich_text_block
 
 
-@pytest.fixture
-def mock_slack_client():
-    """Create a mock Slack client."""
-    with patch("slack_lists_mcp.slack_client.WebClient") as mock:
-        mock_instance = MagicMock()
-        mock.return_value = mock_instance
-        yield mock_instance
-
-
-@pytest.mark.asyncio
-async def test_client_initialization(mock_slack_client):
+def test_client_initialization(mock_slack_client):
     """Test SlackListsClient initialization."""
-    with patch.dict("os.environ", {"SLACK_BOT_TOKEN": "test-token"}):
-        client = SlackListsClient()
-        assert client.client is not None
-
-
-@pytest.mark.asyncio
-async def test_add_item(mock_slack_client):
-    """Test adding an item to a list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "item": {
-                "id": "Rec123",
-                "list_id": "F123",
-                "fields": [
-                    {"column_id": "Col123", "text": "Test Item"},
-                ],
-            },
-        },
-    )
-
     client = SlackListsClient()
-    client.client = mock_slack_client
-
-    result = await client.add_item(
-        list_id="F123",
-        initial_fields=[
-            {
-                "column_id": "Col123",
-                "rich_text": [
-                    {
-                        "type": "rich_text",
-                        "elements": [
-                            {
-                                "type": "rich_text_section",
-                                "elements": [{"type": "text", "text": "Test Item"}],
-                            },
-                        ],
-                    },
-                ],
-            },
-        ],
-    )
-
-    assert result["id"] == "Rec123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.create",
-        json={
-            "list_id": "F123",
-            "initial_fields": [
-                {
-                    "column_id": "Col123",
-                    "rich_text": [
-                        {
-                            "type": "rich_text",
-                            "elements": [
-                                {
-                                    "type": "rich_text_section",
-                                    "elements": [{"type": "text", "text": "Test Item"}],
-                                },
-                            ],
-                        },
-                    ],
-                },
-            ],
+    assert client.client is not None
+
+
+_ADDED_ITEM = {
+    "id": "Rec123",
+    "list_id": "F123",
+    "fields": [
+        {"column_id": "Col123", "text": "Test Item"},
+    ],
+}
+
+_RECORD = {
+    "id": "Rec123",
+    "fields": [
+        {"column_id": "Col123", "text": "Test Item"},
+    ],
+}
+
+_LISTED_ITEMS = [
+    {"id": "Rec1", "fields": []},
+    {"id": "Rec2", "fields": []},
+]
+
+# Already in rich_text form, so add_item sends it unchanged
+_ADD_ITEM_KWARGS = {
+    "list_id": "F123",
+    "initial_fields": [
+        {"column_id": "Col123", "rich_text": rich_text_block("Test Item")},
+    ],
+}
+
+_UPDATE_ITEM_KWARGS = {
+    "list_id": "F123",
+    "cells": [
+        {
+            "row_id": "Rec123",
+            "column_id": "Col123",
+            "text": "Updated Item",
         },
-    )
-
-
-@pytest.mark.asyncio
-async def test_update_item(mock_slack_client):
-    """Test updating items in a list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    result = await client.update_item(
-        list_id="F123",
-        cells=[
-            {
-                "row_id": "Rec123",
-                "column_id": "Col123",
-                "text": "Updated Item",
-            },
-        ],
-    )
-
-    assert result["success"] is True
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.update",
-        json={
-            "list_id": "F123",
-            "cells": [
-                {
-                    "row_id": "Rec123",
-                    "column_id": "Col123",
-                    "rich_text": [
-                        {
-                            "type": "rich_text",
-                            "elements": [
-                                {
-                                    "type": "rich_text_section",
-                                    "elements": [
-                                        {"type": "text", "text": "Updated Item"}
-                                    ],
-                                }
-                            ],
-                        }
-                    ],
-                },
-            ],
+    ],
+}
+
+# Plain text is normalized to rich_text before sending
+_UPDATE_ITEM_EXPECTED_JSON = {
+    "list_id": "F123",
+    "cells": [
+        {
+            "row_id": "Rec123",
+            "column_id": "Col123",
+            "rich_text": rich_text_block("Updated Item"),
         },
-    )
-
-
-@pytest.mark.asyncio
-async def test_delete_item(mock_slack_client):
-    """Test deleting an item from a list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    result = await client.delete_item(
-        list_id="F123",
-        item_id="Rec123",
-    )
-
-    assert result["deleted"] is True
-    assert result["item_id"] == "Rec123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.delete",
-        json={"list_id": "F123", "id": "Rec123"},
-    )
-
-
-@pytest.mark.asyncio
-async def test_get_item(mock_slack_client):
-    """Test getting a specific item."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "record": {
-                "id": "Rec123",
-                "fields": [
-                    {"column_id": "Col123", "text": "Test Item"},
-                ],
-            },
+    ],
+}
+
+_ITEM_KWARGS = {"list_id": "F123", "item_id": "Rec123"}
+
+# Item lookups send the id as "id"
+_ITEM_EXPECTED_JSON = {"list_id": "F123", "id": "Rec123"}
+
+# (client method, kwargs, api_call response, expected api_method,
+#  expected json body, expected result)
+API_CALL_CASES = [
+    pytest.param(
+        "add_item",
+        _ADD_ITEM_KWARGS,
+        {"ok": True, "item": _ADDED_ITEM},
+        "slackLists.items.create",
+        _ADD_ITEM_KWARGS,
+        _ADDED_ITEM,
+        id="add_item",
+    ),
+    pytest.param(
+        "update_item",
+        _UPDATE_ITEM_KWARGS,
+        {"ok": True},
+        "slackLists.items.update",
+        _UPDATE_ITEM_EXPECTED_JSON,
+        {"success": True},
+        id="update_item",
+    ),
+    pytest.param(
+        "delete_item",
+        _ITEM_KWARGS,
+        {"ok": True},
+        "slackLists.items.delete",
+        _ITEM_EXPECTED_JSON,
+        {"deleted": True, "item_id": "Rec123"},
+        id="delete_item",
+    ),
+    pytest.param(
+        "get_item",
+        _ITEM_KWARGS,
+        {"ok": True, "record": _RECORD, "list": {"list_metadata": {"schema": []}}},
+        "slackLists.items.info",
+        # include_is_subscribed is not included when False
+        _ITEM_EXPECTED_JSON,
+        # get_item returns item (from record), list, and subtasks
+        {
+            "item": _RECORD,
             "list": {"list_metadata": {"schema": []}},
+            "subtasks": [],
         },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    result = await client.get_item(
-        list_id="F123",
-        item_id="Rec123",
-    )
-
-    # get_item returns item (from record), list, and subtasks
-    assert "item" in result
-    assert result["item"]["id"] == "Rec123"
-    # include_is_subscribed is not included when False
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.info",
-        json={"list_id": "F123", "id": "Rec123"},
-    )
+        id="get_item",
+    ),
+    pytest.param(
+        "list_items",
+        {"list_id": "F123", "limit": 100},
+        {"ok": True, "items": _LISTED_ITEMS},
+        "slackLists.items.list",
+        {"list_id": "F123", "limit": 100},
+        {
+            "items": _LISTED_ITEMS,
+            "has_more": False,
+            "next_cursor": None,
+            "total": 2,
+        },
+        id="list_items_without_filters",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs", "response", "api_method", "json_body", "expected"),
+    API_CALL_CASES,
+)
+async def test_api_call(
+    mock_slack_client,
+    client,
+    method,
+    kwargs,
+    response,
+    api_method,
+    json_body,
+    expected,
+):
+    """Test each client method sends the right request and shapes the response."""
+    mock_slack_client.api_call.return_value = response
+
+    result = await getattr(client, method)(**kwargs)
+
+    assert result == expected
+    (call,) = mock_slack_client.api_call.call_args_list
+    assert call.kwargs == {
+        "api_method": api_method,
+        "json": json_body,
+    }
 
 
-@pytest.mark.asyncio
-async def test_list_items_without_filters(mock_slack_client):
-    """Test listing items without filters."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "items": [
-                {"id": "Rec1", "fields": []},
-                {"id": "Rec2", "fields": []},
+_UNFILTERED_LIST_RESPONSE = {
+    "ok": True,
+    "items": [
+        {
+            "id": "Rec1",
+            "fields": [
+                {"key": "name", "text": "Test Item"},
+                {"key": "status", "select": ["active"]},
             ],
         },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    result = await client.list_items(
-        list_id="F123",
-        limit=100,
-    )
-
-    assert len(result["items"]) == 2
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.list",
-        json={"list_id": "F123", "limit": 100},
-    )
-
-
-@pytest.mark.asyncio
-async def test_list_items_with_filters(mock_slack_client):
-    """Test listing items with client-side filters."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "items": [
-                {
-                    "id": "Rec1",
-                    "fields": [
-                        {"key": "name", "text": "Test Item"},
-                        {"key": "status", "select": ["active"]},
-                    ],
-                },
-                {
-                    "id": "Rec2",
-                    "fields": [
-                        {"key": "name", "text": "Another Item"},
-                        {"key": "status", "select": ["inactive"]},
-                    ],
-                },
+        {
+            "id": "Rec2",
+            "fields": [
+                {"key": "name", "text": "Another Item"},
+                {"key": "status", "select": ["inactive"]},
             ],
         },
-    )
+    ],
+}
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
+
+async def test_list_items_with_filters(mock_slack_client, client):
+    """Test listing items with client-side filters."""
+    mock_slack_client.api_call.return_value = _UNFILTERED_LIST_RESPONSE
 
     result = await client.list_items(
         list_id="F123",
@@ -262,157 +199,241 @@ async def test_list_items_with_filters(mock_slack_client):
     assert result["items"][0]["id"] == "Rec1"
 
     # Should request more items when filtering
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.list",
-        json={"list_id": "F123", "limit": 300},  # 3x the requested limit
-    )
+    (call,) = mock_slack_client.api_call.call_args_list
+    assert call.kwargs == {
+        "api_method": "slackLists.items.list",
+        "json": {"list_id": "F123", "limit": 300},  # 3x the requested limit
+    }
+
+
+@pytest.fixture(scope="module")
+def filter_client(_web_client_patch):
+    """Client for the pure filtering/extraction helpers, built once per module."""
+    return SlackListsClient()
 
 
-@pytest.mark.asyncio
-async def test_filter_matching_logic():
+# Read-only so no case can leak changes into the next one. The select value
+# stays a list: the client treats single-element lists as scalars.
+ITEM = MappingProxyType(
+    {
+        "fields": (
+            MappingProxyType({"key": "status", "select": ["active"]}),
+            MappingProxyType({"key": "name", "text": "Test Item"}),
+        ),
+    },
+)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        # equals operator
+        ({"status": {"equals": "active"}}, True),
+        ({"status": {"equals": "inactive"}}, False),
+        # contains operator
+        ({"name": {"contains": "Test"}}, True),
+        ({"name": {"contains": "test"}}, True),  # Case-insensitive
+        ({"name": {"contains": "Other"}}, False),
+        # not_equals operator
+        ({"status": {"not_equals": "inactive"}}, True),
+        ({"status": {"not_equals": "active"}}, False),
+        # not_contains operator
+        ({"name": {"not_contains": "Other"}}, True),
+        ({"name": {"not_contains": "Test"}}, False),
+        # in operator
+        ({"status": {"in": ["active", "pending"]}}, True),
+        ({"status": {"in": ["inactive", "pending"]}}, False),
+        # not_in operator
+        ({"status": {"not_in": ["inactive", "pending"]}}, True),
+        ({"status": {"not_in": ["active", "pending"]}}, False),
+        # multiple filters (AND logic)
+        ({"status": {"equals": "active"}, "name": {"contains": "Test"}}, True),
+        ({"status": {"equals": "active"}, "name": {"contains": "Other"}}, False),
+    ],
+)
+def test_filter_matching_logic(filter_client, filters, expected):
     """Test the filter matching logic directly."""
-    client = SlackListsClient()
+    assert filter_client._matches_filters(ITEM, filters) is expected
+
 
-    # Test equals operator
-    item = {
+_OPTIONS = ("opt1", "opt2", "opt3")
+
+_COMPLEMENTS = [
+    ("equals", "not_equals"),
+    ("contains", "not_contains"),
+    ("in", "not_in"),
+]
+
+_NAMES = st.text(alphabet=string.ascii_letters + " ", max_size=12)
+_SELECTS = st.lists(st.sampled_from(_OPTIONS), max_size=3)
+
+
+def _item(name, select):
+    """Build an item with a text ``name`` column and a select ``status`` column."""
+    return {
         "fields": [
-            {"key": "status", "select": ["active"]},
-            {"key": "name", "text": "Test Item"},
+            {"key": "name", "text": name},
+            {"key": "status", "select": select},
         ],
     }
 
-    assert client._matches_filters(item, {"status": {"equals": "active"}}) is True
-    assert client._matches_filters(item, {"status": {"equals": "inactive"}}) is False
-
-    # Test contains operator
-    assert client._matches_filters(item, {"name": {"contains": "Test"}}) is True
-    assert (
-        client._matches_filters(item, {"name": {"contains": "test"}}) is True
-    )  # Case-insensitive
-    assert client._matches_filters(item, {"name": {"contains": "Other"}}) is False
-
-    # Test not_equals operator
-    assert client._matches_filters(item, {"status": {"not_equals": "inactive"}}) is True
-    assert client._matches_filters(item, {"status": {"not_equals": "active"}}) is False
 
-    # Test not_contains operator
-    assert client._matches_filters(item, {"name": {"not_contains": "Other"}}) is True
-    assert client._matches_filters(item, {"name": {"not_contains": "Test"}}) is False
+def _reference_match(value, operator, expected):
+    """Plain statement of what each positive operator means for one column.
+
+    ``value`` is a text column's string or a select column's option list.
+    """
+    values = value if isinstance(value, list) else [value]
+    if operator == "equals":
+        # A select equals an option only when that is its single selection
+        return values == [expected]
+    if operator == "contains":
+        return any(expected.lower() in v.lower() for v in values)
+    # "in": some selected option (or the text itself) is one of the expected
+    return any(v in expected for v in values)
+
+
+@st.composite
+def _filter_cases(draw):
+    """Draw an item plus a filter whose values often come from the item."""
+    name = draw(_NAMES)
+    select = draw(_SELECTS)
+    key = draw(st.sampled_from(["name", "status"]))
+    operator, negated = draw(st.sampled_from(_COMPLEMENTS))
+    if key == "name":
+        start = draw(st.integers(0, len(name)))
+        end = draw(st.integers(start, len(name)))
+        candidates = st.one_of(
+            st.just(name),
+            st.just(name[start:end].swapcase()),
+            _NAMES,
+        )
+    else:
+        candidates = st.sampled_from(_OPTIONS)
+    if operator == "in":
+        expected = draw(st.lists(candidates, max_size=3))
+    else:
+        expected = draw(candidates)
+    return _item(name, select), key, operator, negated, expected
+
+
+@settings(max_examples=200)
+@given(case=_filter_cases())
+def test_filter_matching_agrees_with_reference(filter_client, case):
+    """Test every operator against a straightforward reference matcher."""
+    item, key, operator, negated, expected = case
+    value = next(f for f in item["fields"] if f["key"] == key)
+    value = value.get("text", value.get("select"))
+    reference = _reference_match(value, operator, expected)
 
-    # Test in operator
     assert (
-        client._matches_filters(item, {"status": {"in": ["active", "pending"]}}) is True
+        filter_client._matches_filters(item, {key: {operator: expected}}) is reference
     )
     assert (
-        client._matches_filters(item, {"status": {"in": ["inactive", "pending"]}})
-        is False
+        filter_client._matches_filters(item, {key: {negated: expected}})
+        is not reference
     )
 
-    # Test not_in operator
-    assert (
-        client._matches_filters(item, {"status": {"not_in": ["inactive", "pending"]}})
-        is True
-    )
-    assert (
-        client._matches_filters(item, {"status": {"not_in": ["active", "pending"]}})
-        is False
-    )
 
-    # Test multiple filters (AND logic)
-    assert (
-        client._matches_filters(
-            item,
-            {
-                "status": {"equals": "active"},
-                "name": {"contains": "Test"},
-            },
-        )
-        is True
-    )
+@settings(max_examples=50)
+@given(name=_NAMES, search=_NAMES)
+def test_contains_ignores_case(filter_client, name, search):
+    """Test contains gives the same answer whatever the case of the search."""
+    item = _item(name, [])
 
-    assert (
-        client._matches_filters(
-            item,
-            {
-                "status": {"equals": "active"},
-                "name": {"contains": "Other"},
-            },
-        )
-        is False
-    )
+    upper = filter_client._matches_filters(item, {"name": {"contains": search.upper()}})
+    lower = filter_client._matches_filters(item, {"name": {"contains": search.lower()}})
 
+    assert upper is lower
 
-@pytest.mark.asyncio
-async def test_field_value_extraction():
-    """Test the field value extraction logic."""
-    client = SlackListsClient()
 
+@settings(max_examples=50)
+@given(
+    name=_NAMES,
+    select=_SELECTS,
+    name_search=_NAMES,
+    status=st.sampled_from(_OPTIONS),
+)
+def test_multiple_filters_are_anded(filter_client, name, select, name_search, status):
+    """Test filters on several columns match only when each one matches alone."""
+    item = _item(name, select)
+    name_filter = {"name": {"contains": name_search}}
+    status_filter = {"status": {"equals": status}}
+
+    both = filter_client._matches_filters(item, name_filter | status_filter)
+    name_only = filter_client._matches_filters(item, name_filter)
+    status_only = filter_client._matches_filters(item, status_filter)
+
+    assert both is (name_only and status_only)
+
+
+def test_field_value_extraction(filter_client):
+    """Test the field value extraction logic."""
     # Test checkbox field
     field = {"checkbox": True}
-    assert client._extract_field_value(field) is True
+    assert filter_client._extract_field_value(field) is True
 
     # Test select field
     field = {"select": ["option1"]}
-    assert client._extract_field_value(field) == ["option1"]
+    assert filter_client._extract_field_value(field) == ["option1"]
 
     # Test user field
     field = {"user": ["U123"]}
-    assert client._extract_field_value(field) == ["U123"]
+    assert filter_client._extract_field_value(field) == ["U123"]
 
     # Test date field
     field = {"date": ["2024-01-01"]}
-    assert client._extract_field_value(field) == ["2024-01-01"]
+    assert filter_client._extract_field_value(field) == ["2024-01-01"]
 
     # Test text field
     field = {"text": "Test Text"}
-    assert client._extract_field_value(field) == "Test Text"
+    assert filter_client._extract_field_value(field) == "Test Text"
 
     # Test number field
     field = {"number": [42]}
-    assert client._extract_field_value(field) == [42]
+    assert filter_client._extract_field_value(field) == [42]
 
     # Test email field
     field = {"email": ["test@example.com"]}
-    assert client._extract_field_value(field) == ["test@example.com"]
+    assert filter_client._extract_field_value(field) == ["test@example.com"]
 
     # Test phone field
     field = {"phone": ["+1234567890"]}
-    assert client._extract_field_value(field) == ["+1234567890"]
+    assert filter_client._extract_field_value(field) == ["+1234567890"]
 
     # Test fallback to value field
     field = {"value": "fallback"}
-    assert client._extract_field_value(field) == "fallback"
+    assert filter_client._extract_field_value(field) == "fallback"
 
     # Test empty field
     field = {}
-    assert client._extract_field_value(field) is None
+    assert filter_client._extract_field_value(field) is None
+
+
+_GET_LIST_RESPONSES = {
+    # items.list finds an item to look up
+    "slackLists.items.list": {
+        "ok": True,
+        "items": [{"id": "Rec1"}],
+    },
+    # items.info carries the list metadata
+    "slackLists.items.info": {
+        "ok": True,
+        "list": {
+            "id": "F123",
+            "name": "Test List",
+            "title": "Test List Title",
+        },
+    },
+}
 
 
-@pytest.mark.asyncio
-async def test_get_list(mock_slack_client):
+async def test_get_list(mock_slack_client, client):
     """Test getting list information."""
-    mock_slack_client.api_call = MagicMock(
-        side_effect=[
-            # First call: items.list
-            {
-                "ok": True,
-                "items": [{"id": "Rec1"}],
-            },
-            # Second call: items.info
-            {
-                "ok": True,
-                "list": {
-                    "id": "F123",
-                    "name": "Test List",
-                    "title": "Test List Title",
-                },
-            },
-        ],
+    mock_slack_client.api_call.side_effect = lambda api_method, **_: (
+        _GET_LIST_RESPONSES[api_method]
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.get_list(list_id="F123")
 
     assert result["id"] == "F123"
@@ -420,55 +441,38 @@ async def test_get_list(mock_slack_client):
     assert mock_slack_client.api_call.call_count == 2
 
 
-@pytest.mark.asyncio
-async def test_get_list_empty(mock_slack_client):
+async def test_get_list_empty(mock_slack_client, client):
     """Test getting list information when list is empty."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "items": [],
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call.return_value = {
+        "ok": True,
+        "items": [],
+    }
 
     result = await client.get_list(list_id="F123")
 
     assert result["id"] == "F123"
     assert "message" in result
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.list",
-        json={"list_id": "F123", "limit": 1},
-    )
+    (call,) = mock_slack_client.api_call.call_args_list
+    assert call.kwargs == {
+        "api_method": "slackLists.items.list",
+        "json": {"list_id": "F123", "limit": 1},
+    }
 
 
-@pytest.mark.asyncio
-async def test_error_handling(mock_slack_client):
-    """Test error handling for API failures."""
-    mock_response = MagicMock()
-    # Create proper response data
-    mock_response.data = {
-        "ok": False,
-        "error": "list_not_found",
-        "error_message": "List not found",
-    }
-    # Ensure get() returns actual string values, not MagicMock
-    mock_response.get = lambda key, default=None: {
-        "error": "list_not_found",
-        "error_message": "List not found",
-        "ok": False,
-    }.get(key, default)
-
-    mock_slack_client.api_call = MagicMock(
-        side_effect=SlackApiError(
-            message="The request to the Slack API failed.",
-            response=mock_response,
-        ),
+def _slack_error(code):
+    """Build the SlackApiError the SDK raises for a failed call with ``code``."""
+    data = {"ok": False, "error": code}
+    response = SimpleNamespace(data=data, get=data.get, status_code=200, headers={})
+    return SlackApiError(
+        message="The request to the Slack API failed.",
+        response=response,
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
+
+@pytest.mark.parametrize("code", ["list_not_found", "invalid_auth", "ratelimited"])
+async def test_error_handling(mock_slack_client, client, code):
+    """Test error handling for API failures."""
+    mock_slack_client.api_call.side_effect = _slack_error(code)
 
     with pytest.raises(Exception) as exc_info:
         await client.add_item(
@@ -476,4 +480,4 @@ async def test_error_handling(mock_slack_client):
             initial_fields=[{"column_id": "Col123", "text": "Test"}],
         )
 
-    assert "list_not_found" in str(exc_info.value)
+    assert code in str(exc_info.value)
@@ -1,26 +1,12 @@
 """Tests for validation error handling."""
 
-from unittest.mock import MagicMock, patch
-
 import pytest
-from slack_lists_mcp.slack_client import SlackListsClient
-
 
-@pytest.fixture
-def mock_slack_client():
-    """Create a mock Slack client."""
-    with patch("slack_lists_mcp.slack_client.WebClient") as mock:
-        mock_instance = MagicMock()
-        mock.return_value = mock_instance
-        yield mock_instance
+_CREATED_RESPONSE = {"ok": True, "item": {"id": "Rec123"}}
 
 
-@pytest.mark.asyncio
-async def test_validation_error_missing_column_id(mock_slack_client):
+async def test_validation_error_missing_column_id(client):
     """Test validation error when column_id is missing."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     with pytest.raises(ValueError, match="Each field must have a 'column_id'"):
         await client.add_item(
             list_id="F123",
@@ -32,12 +18,8 @@ async def test_validation_error_missing_column_id(mock_slack_client):
         )
 
 
-@pytest.mark.asyncio
-async def test_validation_error_missing_value(mock_slack_client):
+async def test_validation_error_missing_value(client):
     """Test validation error when field has no value."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     with pytest.raises(ValueError, match="must have a value"):
         await client.add_item(
             list_id="F123",
@@ -50,15 +32,11 @@ async def test_validation_error_missing_value(mock_slack_client):
         )
 
 
-@pytest.mark.asyncio
-async def test_validation_success_with_valid_fields(mock_slack_client):
+async def test_validation_success_with_valid_fields(mock_slack_client, client):
     """Test that valid fields pass validation."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True, "item": {"id": "Rec123"}},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    # No call assertions below, so a plain function is enough. mock_slack_client
+    # installs a fresh api_call for every test, so the swap doesn't leak.
+    mock_slack_client.api_call = lambda **_: _CREATED_RESPONSE
 
     # This should not raise an exception
     result = await client.add_item(